@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+本地媒体测试服务器
+功能：在本机提供合成媒体文件，可配置延迟、带宽、Range支持和失败率
+用途：基准测试时代替真实的媒体链接，不依赖外部网络
+"""
+
+import http.server
+import random
+import re
+import threading
+import time
+import urllib.parse
+
+
+class MediaRequestHandler(http.server.BaseHTTPRequestHandler):
+    """合成媒体请求处理器
+
+    请求路径格式: /media/<名称>.<扩展名>?size=<字节数>
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        """关闭默认的访问日志"""
+        pass
+
+    def do_GET(self):
+        """处理GET请求"""
+        server = self.server
+        parsed = urllib.parse.urlparse(self.path)
+        if not parsed.path.startswith('/media/'):
+            self.send_error(404)
+            return
+
+        query = urllib.parse.parse_qs(parsed.query)
+        try:
+            size = int(query.get('size', [server.default_size])[0])
+        except ValueError:
+            self.send_error(400)
+            return
+
+        # 模拟网络延迟（首字节之前）
+        if server.latency > 0:
+            time.sleep(server.latency)
+
+        failure = server.next_failure()
+        if failure == 'status':
+            self.send_error(503)
+            return
+
+        start, end = 0, size - 1
+        status = 200
+        range_header = self.headers.get('Range')
+        if server.range_support and range_header:
+            match = re.match(r'bytes=(\d*)-(\d*)$', range_header.strip())
+            if match and (match.group(1) or match.group(2)):
+                if match.group(1):
+                    start = int(match.group(1))
+                    if match.group(2):
+                        end = min(int(match.group(2)), size - 1)
+                else:
+                    start = max(size - int(match.group(2)), 0)
+                if start > end:
+                    self.send_response(416)
+                    self.send_header('Content-Range', f'bytes */{size}')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                status = 206
+
+        length = end - start + 1
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(length))
+        if server.range_support:
+            self.send_header('Accept-Ranges', 'bytes')
+        if status == 206:
+            self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+        if failure == 'drop':
+            # 发送一半内容后断开连接，模拟传输中断
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+            length //= 2
+        self.end_headers()
+
+        self.write_body(start, length)
+
+    def write_body(self, offset, length):
+        """按带宽限制写出合成内容"""
+        server = self.server
+        chunk_size = server.chunk_size
+        payload = server.payload
+        sent = 0
+        began = time.perf_counter()
+        while sent < length:
+            n = min(chunk_size, length - sent)
+            pos = (offset + sent) % 256
+            chunk = payload[pos:pos + n]
+            try:
+                self.wfile.write(chunk)
+            except (BrokenPipeError, ConnectionResetError):
+                return
+            sent += n
+            if server.bandwidth > 0:
+                # 按已发送字节数计算应到达的时间点，超前则等待
+                expected = sent / server.bandwidth
+                elapsed = time.perf_counter() - began
+                if expected > elapsed:
+                    time.sleep(expected - elapsed)
+
+
+class MediaServer(http.server.ThreadingHTTPServer):
+    """多线程本地媒体服务器
+
+    参数:
+        latency: 每个请求返回首字节前的延迟（秒）
+        bandwidth: 每个连接的带宽上限（字节/秒），0表示不限速
+        range_support: 是否支持Range请求
+        fail_rate: 请求失败的概率（0~1）
+        fail_mode: 失败方式，'status' 返回503，'drop' 传输一半后断开
+        default_size: 未指定size参数时的文件大小（字节）
+        seed: 失败序列的随机种子，保证结果可复现
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, bandwidth=0,
+                 range_support=True, fail_rate=0.0, fail_mode='status',
+                 default_size=1024 * 1024, chunk_size=16 * 1024, seed=0):
+        if fail_mode not in ('status', 'drop'):
+            raise ValueError(f"不支持的失败方式: {fail_mode}")
+        super().__init__((host, port), MediaRequestHandler)
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.range_support = range_support
+        self.fail_rate = fail_rate
+        self.fail_mode = fail_mode
+        self.default_size = default_size
+        self.chunk_size = chunk_size
+        # 内容为循环的0~255字节，任意偏移处的内容都可预测
+        self.payload = bytes(range(256)) * (chunk_size // 256 + 2)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """服务器根地址"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def media_url(self, name, size=None):
+        """生成合成媒体文件的链接"""
+        url = f"{self.base_url}/media/{urllib.parse.quote(name)}"
+        if size is not None:
+            url += f"?size={size}"
+        return url
+
+    def next_failure(self):
+        """决定本次请求是否失败，返回失败方式或None"""
+        if self.fail_rate <= 0:
+            return None
+        with self._lock:
+            if self._random.random() < self.fail_rate:
+                return self.fail_mode
+        return None
+
+    def start(self):
+        """在后台线程中启动服务器"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """停止服务器"""
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
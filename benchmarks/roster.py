@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+合成名单生成器
+功能：按 数据模板.csv 的格式生成指定行数的测试名单
+"""
+
+import csv
+import random
+
+FIELDNAMES = ['展演号码', '姓名', '作品名称', '媒体链接']
+
+SURNAMES = '张李王赵刘陈杨黄周吴徐孙马朱胡郭何高林罗'
+GIVEN_NAMES = '伟芳娜敏静丽强磊军洋勇艳杰娟涛明超秀霞平刚'
+WORK_PREFIXES = ['春天的', '夏日的', '秋天的', '冬夜的', '远方的', '故乡的', '星空下的', '海边的']
+WORK_SUFFIXES = ['故事', '风情', '童话', '歌谣', '回忆', '梦想', '诗篇', '旋律']
+EXTENSIONS = ['mp3', 'mp4']
+
+
+def generate_rows(count, base_url="http://example.com", media_size=None, seed=0):
+    """生成名单行（字典列表），展演号码按行数补零对齐"""
+    rng = random.Random(seed)
+    width = max(3, len(str(count)))
+    rows = []
+    for i in range(1, count + 1):
+        number = str(i).zfill(width)
+        name = rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES) + rng.choice(GIVEN_NAMES)
+        work_name = rng.choice(WORK_PREFIXES) + rng.choice(WORK_SUFFIXES)
+        url = f"{base_url}/media/{number}.{EXTENSIONS[i % len(EXTENSIONS)]}"
+        if media_size is not None:
+            url += f"?size={media_size}"
+        rows.append({
+            '展演号码': number,
+            '姓名': name,
+            '作品名称': work_name,
+            '媒体链接': url,
+        })
+    return rows
+
+
+def write_roster(file_path, count, base_url="http://example.com", media_size=None,
+                 seed=0, encoding='utf-8'):
+    """生成名单并写入CSV文件，返回写入的行"""
+    rows = generate_rows(count, base_url, media_size, seed)
+    with open(file_path, 'w', encoding=encoding, newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rows)
+    return rows
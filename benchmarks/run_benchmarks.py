@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+朗润播放器客户端 - 基准测试
+场景：CSV导入、列表刷新、展演号码查找、批量下载吞吐量
+用法：python benchmarks/run_benchmarks.py [--rows 1000,10000,100000] [--profile]
+"""
+
+import argparse
+import cProfile
+import io
+import json
+import os
+import pstats
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import 朗润播放器客户端_独立版 as player  # noqa: E402
+from media_server import MediaServer  # noqa: E402
+from roster import write_roster  # noqa: E402
+
+
+class ListTree:
+    """无图形界面时代替ttk.Treeview的简单列表（只实现update_file_list用到的方法）"""
+
+    def __init__(self):
+        self.items = {}
+        self.counter = 0
+
+    def get_children(self):
+        return tuple(self.items)
+
+    def delete(self, item):
+        del self.items[item]
+
+    def insert(self, parent, index, values=()):
+        self.counter += 1
+        item = f"I{self.counter:06X}"
+        self.items[item] = values
+        return item
+
+
+class SearchVar:
+    """代替tk.StringVar的搜索框内容"""
+
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class BenchPlayer(player.SimpleMediaPlayer):
+    """只记录播放请求、不启动系统播放器的播放器"""
+
+    def __init__(self):
+        super().__init__()
+        self.played = 0
+
+    def play_file(self, file_path):
+        self.current_file = file_path
+        self.played += 1
+        return True
+
+
+def make_tk_root():
+    """创建隐藏的Tk根窗口，无图形界面时返回None"""
+    try:
+        root = player.tk.Tk()
+    except player.tk.TclError:
+        return None
+    root.withdraw()
+    return root
+
+
+def make_tree(root):
+    """创建列表控件：有Tk根窗口时使用真实的Treeview，否则使用ListTree"""
+    if root is not None:
+        columns = ('展演号码', '姓名', '作品名称', '状态', '文件路径')
+        return player.ttk.Treeview(root, columns=columns, show='headings'), 'ttk.Treeview'
+    return ListTree(), 'ListTree'
+
+
+def make_app(data, columns, downloader, tree):
+    """构造不创建主窗口的应用实例，用于调用列表刷新和查找逻辑"""
+    app = player.LangrunPlayerApp.__new__(player.LangrunPlayerApp)
+    app.data = data
+    app.columns = columns
+    app.media_data = {}
+    app.downloader = downloader
+    app.player = BenchPlayer()
+    app.tree = tree
+    app.search_var = SearchVar()
+    app.add_log = lambda message: None
+    return app
+
+
+def timeit(func, repeat):
+    """重复执行并返回每次耗时（秒）"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def summarize(name, times, **extra):
+    """汇总耗时数据"""
+    result = {
+        'scenario': name,
+        'repeat': len(times),
+        'min_ms': round(min(times) * 1000, 3),
+        'median_ms': round(statistics.median(times) * 1000, 3),
+        'max_ms': round(max(times) * 1000, 3),
+    }
+    result.update(extra)
+    return result
+
+
+class Profiler:
+    """可选的cProfile开关，关闭时不产生任何开销"""
+
+    def __init__(self, enabled, output_dir=None, top=20):
+        self.enabled = enabled
+        self.output_dir = output_dir
+        self.top = top
+
+    def run(self, name, func):
+        if not self.enabled:
+            return func()
+        profile = cProfile.Profile()
+        try:
+            return profile.runcall(func)
+        finally:
+            if self.output_dir:
+                os.makedirs(self.output_dir, exist_ok=True)
+                profile.dump_stats(os.path.join(self.output_dir, f"{name}.prof"))
+            stream = io.StringIO()
+            pstats.Stats(profile, stream=stream).sort_stats('cumulative').print_stats(self.top)
+            print(f"---- cProfile: {name} ----")
+            print(stream.getvalue())
+
+
+def bench_read_file(csv_path, rows, repeat):
+    """场景：SimpleExcelReader.read_file 读取名单"""
+    times = timeit(lambda: player.SimpleExcelReader.read_file(csv_path), repeat)
+    return summarize('read_file', times, rows=rows)
+
+
+def bench_update_file_list(app, rows, repeat, tree_kind):
+    """场景：update_file_list 刷新作品列表"""
+    times = timeit(app.update_file_list, repeat)
+    return summarize('update_file_list', times, rows=rows, tree=tree_kind)
+
+
+def bench_search(app, rows, lookups, repeat):
+    """场景：search_and_play 按展演号码查找（均为已下载的作品）"""
+    numbers = list(app.media_data)
+    if lookups <= 0 or not numbers:
+        return None
+    step = max(1, len(numbers) // lookups)
+    targets = (numbers[::step] * (lookups // len(numbers[::step]) + 1))[:lookups]
+
+    def run():
+        for number in targets:
+            app.search_var.set(number)
+            app.search_and_play()
+
+    times = timeit(run, repeat)
+    return summarize('search_and_play', times, rows=rows, lookups=lookups,
+                     per_lookup_us=round(statistics.median(times) / lookups * 1e6, 3))
+
+
+def run_list_scenarios(rows, workdir, args, profiler, tk_root):
+    """针对一个名单规模运行导入、刷新和查找场景"""
+    csv_path = os.path.join(workdir, f"roster_{rows}.csv")
+    write_roster(csv_path, rows)
+
+    results = [profiler.run(f"read_file_{rows}",
+                            lambda: bench_read_file(csv_path, rows, args.repeat))]
+
+    data, columns = player.SimpleExcelReader.read_file(csv_path)
+
+    # 所有链接都指向同一个已存在的文件，使列表显示为“已下载”，查找时直接播放
+    media_file = os.path.join(workdir, "media.bin")
+    with open(media_file, 'wb') as f:
+        f.write(b'\0')
+    downloader = player.MediaDownloader(download_dir=os.path.join(workdir, "list_media"))
+    downloader.downloaded_files = {row['媒体链接']: media_file for row in data}
+
+    tree, tree_kind = make_tree(tk_root)
+    app = make_app(data, columns, downloader, tree)
+    results.append(profiler.run(f"update_file_list_{rows}",
+                                lambda: bench_update_file_list(app, rows, args.repeat, tree_kind)))
+    search = profiler.run(f"search_and_play_{rows}",
+                          lambda: bench_search(app, rows, args.lookups, args.repeat))
+    if search:
+        results.append(search)
+    if tree_kind == 'ttk.Treeview':
+        tree.destroy()
+    return results
+
+
+def bench_downloads(workdir, args):
+    """场景：MediaDownloader 批量下载吞吐量（本地媒体服务器）"""
+    server = MediaServer(latency=args.latency, bandwidth=args.bandwidth,
+                         range_support=not args.no_range, fail_rate=args.fail_rate,
+                         fail_mode=args.fail_mode, default_size=args.size)
+    with server:
+        downloader = player.MediaDownloader(download_dir=os.path.join(workdir, "downloads"),
+                                            collect_metrics=True)
+        downloader.log = lambda message: None
+        urls = [server.media_url(f"{i:05d}.mp3") for i in range(1, args.downloads + 1)]
+
+        start = time.perf_counter()
+        succeeded = 0
+        for i, url in enumerate(urls, 1):
+            if downloader.download_file(url, f"作品{i}", str(i)):
+                succeeded += 1
+        elapsed = time.perf_counter() - start
+
+    if args.metrics:
+        downloader.export_metrics(args.metrics)
+
+    metrics = [m for m in downloader.download_metrics if 'error' not in m]
+    total_bytes = sum(m['bytes'] for m in metrics)
+
+    def median_of(key):
+        values = [m[key] for m in metrics if m[key] is not None]
+        return round(statistics.median(values), 3) if values else None
+
+    return {
+        'scenario': 'download_batch',
+        'downloads': len(urls),
+        'succeeded': succeeded,
+        'failed': len(urls) - succeeded,
+        'size_bytes': args.size,
+        'elapsed_ms': round(elapsed * 1000, 3),
+        'files_per_sec': round(len(urls) / elapsed, 2),
+        'bytes_per_sec': round(total_bytes / elapsed, 1),
+        'median_dns_ms': median_of('dns_ms'),
+        'median_connect_ms': median_of('connect_ms'),
+        'median_ttfb_ms': median_of('ttfb_ms'),
+        'median_throughput_bps': median_of('throughput_bps'),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="朗润播放器客户端基准测试")
+    parser.add_argument('--rows', default='1000,10000,100000',
+                        help="名单规模，逗号分隔（默认 1000,10000,100000）")
+    parser.add_argument('--repeat', type=int, default=5, help="每个列表场景的重复次数")
+    parser.add_argument('--lookups', type=int, default=10000, help="查找场景的查找次数，0表示跳过")
+    parser.add_argument('--tk', action='store_true',
+                        help="使用真实的ttk.Treeview（需要图形界面）")
+    parser.add_argument('--downloads', type=int, default=50, help="批量下载的文件数，0表示跳过")
+    parser.add_argument('--size', type=int, default=256 * 1024, help="每个媒体文件的大小（字节）")
+    parser.add_argument('--latency', type=float, default=0.0, help="服务器首字节延迟（秒）")
+    parser.add_argument('--bandwidth', type=int, default=0, help="服务器每连接带宽（字节/秒），0为不限")
+    parser.add_argument('--no-range', action='store_true', help="服务器不支持Range请求")
+    parser.add_argument('--fail-rate', type=float, default=0.0, help="服务器请求失败概率（0~1）")
+    parser.add_argument('--fail-mode', choices=['status', 'drop'], default='status',
+                        help="失败方式：status返回503，drop传输中断开")
+    parser.add_argument('--metrics', help="将每次下载的计时数据导出为JSON文件")
+    parser.add_argument('--json', help="将基准测试结果保存为JSON文件")
+    parser.add_argument('--profile', action='store_true', help="使用cProfile分析每个场景")
+    parser.add_argument('--profile-dir', help="保存.prof文件的目录（配合--profile使用）")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat 必须大于0")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    profiler = Profiler(args.profile, args.profile_dir)
+    results = []
+
+    tk_root = make_tk_root() if args.tk else None
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="langrun_bench_") as workdir:
+            for rows in [int(n) for n in args.rows.split(',') if n.strip()]:
+                results.extend(run_list_scenarios(rows, workdir, args, profiler, tk_root))
+            if args.downloads > 0:
+                results.append(profiler.run("download_batch", lambda: bench_downloads(workdir, args)))
+    finally:
+        if tk_root is not None:
+            tk_root.destroy()
+
+    for result in results:
+        print(json.dumps(result, ensure_ascii=False))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+下载计时和本地媒体服务器的冒烟测试
+用法：python -m unittest discover benchmarks
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import 朗润播放器客户端_独立版 as player  # noqa: E402
+from media_server import MediaServer  # noqa: E402
+
+
+class MediaServerTest(unittest.TestCase):
+    """本地媒体服务器的Range和失败处理"""
+
+    def test_range_request(self):
+        with MediaServer() as server:
+            req = urllib.request.Request(server.media_url('a.mp3', 1000),
+                                         headers={'Range': 'bytes=10-19'})
+            with urllib.request.urlopen(req, timeout=10) as response:
+                self.assertEqual(response.status, 206)
+                self.assertEqual(response.headers['Content-Range'], 'bytes 10-19/1000')
+                self.assertEqual(response.read(), bytes(range(10, 20)))
+
+    def test_range_not_satisfiable(self):
+        with MediaServer() as server:
+            req = urllib.request.Request(server.media_url('a.mp3', 100),
+                                         headers={'Range': 'bytes=200-'})
+            with self.assertRaises(urllib.error.HTTPError) as ctx:
+                urllib.request.urlopen(req, timeout=10)
+            self.assertEqual(ctx.exception.code, 416)
+            self.assertEqual(ctx.exception.headers['Content-Range'], 'bytes */100')
+
+    def test_range_ignored_when_disabled(self):
+        with MediaServer(range_support=False) as server:
+            req = urllib.request.Request(server.media_url('a.mp3', 100),
+                                         headers={'Range': 'bytes=10-19'})
+            with urllib.request.urlopen(req, timeout=10) as response:
+                self.assertEqual(response.status, 200)
+                self.assertEqual(len(response.read()), 100)
+
+    def test_status_failure(self):
+        with MediaServer(fail_rate=1.0) as server:
+            with self.assertRaises(urllib.error.HTTPError) as ctx:
+                urllib.request.urlopen(server.media_url('a.mp3', 100), timeout=10)
+            self.assertEqual(ctx.exception.code, 503)
+
+
+class DownloadMetricsTest(unittest.TestCase):
+    """MediaDownloader的计时记录和导出"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.download_dir = os.path.join(self.tmp.name, "media")
+        self.downloader = player.MediaDownloader(download_dir=self.download_dir,
+                                                 collect_metrics=True)
+        self.downloader.log = lambda message: None
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_download_records_metrics(self):
+        with MediaServer() as server:
+            local_path = self.downloader.download_file(
+                server.media_url('001.mp3', 50000), '作品1', '001')
+
+        self.assertEqual(os.path.dirname(local_path), self.download_dir)
+        self.assertEqual(os.path.getsize(local_path), 50000)
+
+        metrics_file = os.path.join(self.tmp.name, "metrics.json")
+        self.downloader.export_metrics(metrics_file)
+        with open(metrics_file, encoding='utf-8') as f:
+            metrics = json.load(f)
+
+        self.assertEqual(len(metrics), 1)
+        entry = metrics[0]
+        for key in ('url', 'dns_ms', 'connect_ms', 'ttfb_ms', 'total_ms',
+                    'bytes', 'expected_bytes', 'throughput_bps'):
+            self.assertIn(key, entry)
+        self.assertNotIn('error', entry)
+        self.assertEqual(entry['bytes'], 50000)
+        self.assertEqual(entry['expected_bytes'], 50000)
+        self.assertGreater(entry['connect_ms'], 0)
+        self.assertGreaterEqual(entry['total_ms'], entry['ttfb_ms'])
+
+    def test_incomplete_download_fails(self):
+        with MediaServer(fail_rate=1.0, fail_mode='drop') as server:
+            url = server.media_url('002.mp3', 50000)
+            self.assertIsNone(self.downloader.download_file(url, '作品2', '002'))
+
+        self.assertNotIn(url, self.downloader.downloaded_files)
+        entry = self.downloader.download_metrics[0]
+        self.assertIn('IncompleteRead', entry['error'])
+        self.assertEqual(entry['bytes'], 25000)
+        self.assertEqual(entry['expected_bytes'], 50000)
+
+    def test_metrics_disabled_by_default(self):
+        downloader = player.MediaDownloader(download_dir=self.download_dir)
+        downloader.log = lambda message: None
+        with MediaServer() as server:
+            self.assertTrue(downloader.download_file(server.media_url('003.mp3', 100), '作品3', '003'))
+        self.assertEqual(downloader.download_metrics, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,7 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import urllib.request
 import urllib.parse
+import http.client
 import os
 import threading
 import time
@@ -66,14 +67,77 @@ class SimpleExcelReader:
         else:
             raise Exception("不支持的文件格式，请使用CSV或Excel文件")
 
+class DownloadTimer:
+    """单次下载的计时记录（DNS解析、建立连接、首字节、吞吐量）"""
+    
+    def __init__(self, url):
+        self.url = url
+        self.dns_ms = 0.0
+        self.connect_ms = 0.0
+        self.start = time.perf_counter()
+        
+    def create_connection(self, address, timeout=socket._GLOBAL_DEFAULT_TIMEOUT, source_address=None):
+        """替代socket.create_connection，分别记录DNS解析和TCP连接耗时"""
+        host, port = address
+        t0 = time.perf_counter()
+        infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        t1 = time.perf_counter()
+        self.dns_ms += (t1 - t0) * 1000
+        
+        # 与socket.create_connection相同的连接方式，直接使用已解析的地址
+        last_error = None
+        for family, socktype, proto, _, sockaddr in infos:
+            sock = None
+            try:
+                sock = socket.socket(family, socktype, proto)
+                if timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+                    sock.settimeout(timeout)
+                if source_address:
+                    sock.bind(source_address)
+                sock.connect(sockaddr)
+                self.connect_ms += (time.perf_counter() - t1) * 1000
+                return sock
+            except OSError as e:
+                last_error = e
+                if sock is not None:
+                    sock.close()
+        raise last_error or OSError(f"无法连接到 {host}:{port}")
+        
+    def connection_class(self, base_class):
+        """返回一个使用本计时器建立连接的HTTP(S)连接工厂"""
+        def factory(*args, **kwargs):
+            conn = base_class(*args, **kwargs)
+            conn._create_connection = self.create_connection
+            return conn
+        return factory
+        
+    def opener(self):
+        """创建带计时功能的urllib opener"""
+        timer = self
+        
+        class TimedHTTPHandler(urllib.request.HTTPHandler):
+            def http_open(self, req):
+                return self.do_open(timer.connection_class(http.client.HTTPConnection), req)
+                
+        class TimedHTTPSHandler(urllib.request.HTTPSHandler):
+            def https_open(self, req):
+                return self.do_open(timer.connection_class(http.client.HTTPSConnection), req,
+                                    context=self._context)
+                
+        return urllib.request.build_opener(TimedHTTPHandler, TimedHTTPSHandler)
+
 class MediaDownloader:
     """媒体文件下载器（纯Python实现）"""
     
-    def __init__(self, progress_callback=None, log_callback=None):
+    def __init__(self, progress_callback=None, log_callback=None, download_dir="downloaded_media",
+                 collect_metrics=False):
         self.progress_callback = progress_callback
         self.log_callback = log_callback
-        self.download_dir = "downloaded_media"
+        self.download_dir = download_dir
         self.downloaded_files = {}
+        # 下载计时统计（默认关闭，由基准测试或诊断时开启）
+        self.collect_metrics = collect_metrics
+        self.download_metrics = []
         self.load_download_history()
         
     def load_download_history(self):
@@ -124,6 +188,10 @@ class MediaDownloader:
         
     def download_file(self, url, display_name, performance_number):
         """下载单个文件（使用urllib）"""
+        timer = None
+        ttfb = None
+        downloaded = 0
+        total_size = 0
         try:
             # 检查是否已下载
             if url in self.downloaded_files:
@@ -145,9 +213,11 @@ class MediaDownloader:
             req.add_header('User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
             
             # 下载文件
-            with urllib.request.urlopen(req, timeout=30) as response:
+            timer = DownloadTimer(url) if self.collect_metrics else None
+            urlopen = timer.opener().open if timer else urllib.request.urlopen
+            with urlopen(req, timeout=30) as response:
+                ttfb = time.perf_counter()
                 total_size = int(response.headers.get('Content-Length', 0))
-                downloaded = 0
                 
                 with open(local_path, 'wb') as f:
                     while True:
@@ -161,6 +231,13 @@ class MediaDownloader:
                             progress = (downloaded / total_size) * 100
                             self.progress_callback(progress)
                             
+            # 连接中途断开时urllib不会报错，需要按Content-Length检查是否完整
+            if total_size > 0 and downloaded < total_size:
+                raise http.client.IncompleteRead(b'', total_size - downloaded)
+                
+            if timer:
+                self.record_metrics(timer, downloaded, ttfb, total_size)
+                
             # 记录下载成功
             self.downloaded_files[url] = local_path
             self.save_download_history()
@@ -169,8 +246,34 @@ class MediaDownloader:
             return local_path
             
         except Exception as e:
+            if timer:
+                self.record_metrics(timer, downloaded, ttfb, total_size, error=f"{type(e).__name__}: {e}")
             self.log(f"下载失败 {display_name}: {e}")
             return None
+            
+    def record_metrics(self, timer, size=0, ttfb=None, expected_size=0, error=None):
+        """记录单次下载的计时数据"""
+        end = time.perf_counter()
+        total = end - timer.start
+        transfer = end - ttfb if ttfb else 0
+        entry = {
+            'url': timer.url,
+            'dns_ms': round(timer.dns_ms, 3),
+            'connect_ms': round(timer.connect_ms, 3),
+            'ttfb_ms': round((ttfb - timer.start) * 1000, 3) if ttfb else None,
+            'total_ms': round(total * 1000, 3),
+            'bytes': size,
+            'expected_bytes': expected_size,
+            'throughput_bps': round(size / transfer, 1) if transfer > 0 else None,
+        }
+        if error:
+            entry['error'] = error
+        self.download_metrics.append(entry)
+        
+    def export_metrics(self, file_path):
+        """将下载计时数据导出为JSON文件"""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.download_metrics, f, ensure_ascii=False, indent=2)
 
 class SimpleMediaPlayer:
     """简化的媒体播放器（使用系统默认播放器）"""